@@ -7,6 +7,7 @@ Outputs CSV, Parquet, metadata JSON per file, plus a processing_summary.csv.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from collections.abc import Sequence
 
@@ -15,11 +16,18 @@ import polars as pl
 from pyngb.batch import BatchProcessor
 
 
+SUFFIXES = (".ngb-ss3", ".ngb-bs3")
+
+
 def discover_test_files(base: Path) -> list[Path]:
-    files = [
-        *base.glob("*.ngb-ss3"),
-        *base.glob("*.ngb-bs3"),
-    ]
+    # One directory pass covers both suffixes; DirEntry.is_file() uses the
+    # type cached by scandir instead of a stat per candidate.
+    with os.scandir(base) as entries:
+        files = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(SUFFIXES) and entry.is_file()
+        ]
     return sorted(files)
 
 
@@ -6,50 +6,134 @@
 pyngb: A Python library for parsing NETZSCH STA NGB files.
 """
 
+from __future__ import annotations
+
+from importlib import import_module
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
 
-from .analysis import dtg, dtg_custom
-from .api.analysis import (
-    add_dtg,
-    apply_dsc_calibration,
-    calculate_table_dtg,
-    normalize_to_initial_mass,
-)
-from .api.loaders import read_ngb, read_ngb_metadata
-from .api.metadata import (
-    get_column_units,
-    set_column_units,
-    mark_baseline_corrected,
-    get_column_baseline_status,
-    inspect_column_metadata,
-)
-from .baseline import BaselineSubtractor
-from .batch import (
-    BatchProcessor,
-    BatchResult,
-    NGBDataset,
-    process_directory,
-    process_files,
-)
-from .config import ParsingConfig
-from .constants import (
-    FileMetadata,
-    BaseColumnMetadata,
-    BaselinableColumnMetadata,
-    SensitivityCalibration,
-    SensitivityFixpoint,
-    TemperatureCalibration,
-    TemperatureFixpoint,
-)
-from .exceptions import (
-    NGBCorruptedFileError,
-    NGBDataTypeError,
-    NGBParseError,
-    NGBResourceLimitError,
-    NGBStreamNotFoundError,
+if TYPE_CHECKING:
+    from .analysis import dtg, dtg_custom
+    from .api.analysis import (
+        add_dtg,
+        apply_dsc_calibration,
+        calculate_table_dtg,
+        normalize_to_initial_mass,
+    )
+    from .api.loaders import read_ngb, read_ngb_metadata
+    from .api.metadata import (
+        get_column_units,
+        set_column_units,
+        mark_baseline_corrected,
+        get_column_baseline_status,
+        inspect_column_metadata,
+    )
+    from .baseline import BaselineSubtractor
+    from .batch import (
+        BatchProcessor,
+        BatchResult,
+        NGBDataset,
+        process_directory,
+        process_files,
+    )
+    from .config import ParsingConfig
+    from .constants import (
+        FileMetadata,
+        BaseColumnMetadata,
+        BaselinableColumnMetadata,
+        SensitivityCalibration,
+        SensitivityFixpoint,
+        TemperatureCalibration,
+        TemperatureFixpoint,
+    )
+    from .exceptions import (
+        NGBCorruptedFileError,
+        NGBDataTypeError,
+        NGBParseError,
+        NGBResourceLimitError,
+        NGBStreamNotFoundError,
+    )
+    from .format import Field, NGBDocument, Table, load_document
+    from .validation import QualityChecker, ValidationResult, validate_sta_data
+
+#: Public name -> defining submodule. Resolved on first attribute access
+#: (PEP 562) so ``import pyngb`` does not pull in polars, pyarrow and scipy
+#: until something that needs them is used.
+_LAZY_EXPORTS: dict[str, str] = {
+    "dtg": ".analysis",
+    "dtg_custom": ".analysis",
+    "add_dtg": ".api.analysis",
+    "apply_dsc_calibration": ".api.analysis",
+    "calculate_table_dtg": ".api.analysis",
+    "normalize_to_initial_mass": ".api.analysis",
+    "read_ngb": ".api.loaders",
+    "read_ngb_metadata": ".api.loaders",
+    "get_column_units": ".api.metadata",
+    "set_column_units": ".api.metadata",
+    "mark_baseline_corrected": ".api.metadata",
+    "get_column_baseline_status": ".api.metadata",
+    "inspect_column_metadata": ".api.metadata",
+    "BaselineSubtractor": ".baseline",
+    "BatchProcessor": ".batch",
+    "BatchResult": ".batch",
+    "NGBDataset": ".batch",
+    "process_directory": ".batch",
+    "process_files": ".batch",
+    "ParsingConfig": ".config",
+    "FileMetadata": ".constants",
+    "BaseColumnMetadata": ".constants",
+    "BaselinableColumnMetadata": ".constants",
+    "SensitivityCalibration": ".constants",
+    "SensitivityFixpoint": ".constants",
+    "TemperatureCalibration": ".constants",
+    "TemperatureFixpoint": ".constants",
+    "NGBCorruptedFileError": ".exceptions",
+    "NGBDataTypeError": ".exceptions",
+    "NGBParseError": ".exceptions",
+    "NGBResourceLimitError": ".exceptions",
+    "NGBStreamNotFoundError": ".exceptions",
+    "Field": ".format",
+    "NGBDocument": ".format",
+    "Table": ".format",
+    "load_document": ".format",
+    "QualityChecker": ".validation",
+    "ValidationResult": ".validation",
+    "validate_sta_data": ".validation",
+}
+
+
+#: Subpackages and modules reachable as ``pyngb.<name>`` after a bare
+#: ``import pyngb``, imported on first access like the exports above.
+_LAZY_SUBMODULES: frozenset[str] = frozenset(
+    {
+        "analysis",
+        "api",
+        "baseline",
+        "batch",
+        "config",
+        "constants",
+        "exceptions",
+        "format",
+        "util",
+        "validation",
+    }
 )
-from .format import Field, NGBDocument, Table, load_document
-from .validation import QualityChecker, ValidationResult, validate_sta_data
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        return import_module(f".{name}", __name__)
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | _LAZY_SUBMODULES)
+
 
 try:
     __version__ = version("pyngb")
@@ -5,7 +5,6 @@ This module provides a clean, simple interface for DTG calculations with smart d
 """
 
 import numpy as np
-from scipy.signal import savgol_filter
 
 __all__ = [
     "dtg",
@@ -13,6 +12,14 @@ __all__ = [
 ]
 
 
+#: Savitzky-Golay (window, polyorder) for each ``smooth`` level
+_SMOOTHING_PARAMS: dict[str, tuple[int, int]] = {
+    "strict": (7, 1),
+    "medium": (25, 2),
+    "loose": (51, 3),
+}
+
+
 def _get_smoothing_params(smooth: str) -> tuple[int, int]:
     """Get window and polynomial order for smoothing level.
 
@@ -26,13 +33,10 @@ def _get_smoothing_params(smooth: str) -> tuple[int, int]:
     tuple[int, int]
         Window length and polynomial order
     """
-    if smooth == "strict":
-        return 7, 1
-    if smooth == "medium":
-        return 25, 2
-    if smooth == "loose":
-        return 51, 3
-    raise ValueError(f"Unknown smooth level: {smooth}")
+    try:
+        return _SMOOTHING_PARAMS[smooth]
+    except KeyError:
+        raise ValueError(f"Unknown smooth level: {smooth}") from None
 
 
 def _validate_input(time: np.ndarray, mass: np.ndarray) -> None:
@@ -68,6 +72,17 @@ def _validate_input(time: np.ndarray, mass: np.ndarray) -> None:
         )
 
 
+def _mass_loss_rate(time: np.ndarray, mass: np.ndarray) -> np.ndarray:
+    """Mass loss rate in mg/min: -dm/dt scaled in place on the gradient.
+
+    Folding the sign and the s -> min factor into one in-place multiply
+    avoids the two full-length temporaries of ``-np.gradient(...) * 60``.
+    """
+    rate = np.gradient(mass, time)
+    rate *= -60
+    return rate  # type: ignore[no-any-return]
+
+
 def dtg(
     time: np.ndarray,
     mass: np.ndarray,
@@ -99,7 +114,8 @@ def dtg(
     Returns
     -------
     np.ndarray
-        DTG values in mg/min. Positive values indicate mass loss.
+        DTG values in mg/min. Positive values indicate mass loss. float32
+        ``mass`` input stays float32; anything else yields float64.
 
     Raises
     ------
@@ -131,10 +147,7 @@ def dtg(
     if method not in ["savgol", "gradient"]:
         raise ValueError(f"Unknown method: {method}")
 
-    if smooth not in ["strict", "medium", "loose"]:
-        raise ValueError(f"Unknown smooth level: {smooth}")
-
-    # Get smoothing parameters
+    # Get smoothing parameters (raises for an unknown level)
     window, polyorder = _get_smoothing_params(smooth)
 
     # Adapt window size for small datasets
@@ -146,13 +159,17 @@ def dtg(
     # Ensure polynomial order is valid
     polyorder = min(polyorder, window - 1)
 
+    # scipy.signal costs most of a second to import; load it on first use so
+    # importing pyngb (e.g. just to parse files) does not pay for it
+    from scipy.signal import savgol_filter
+
     if method == "savgol":
         # Smooth the mass curve, then differentiate (in mg/min)
         mass_smooth = savgol_filter(mass, window, polyorder)
-        dtg_values = -np.gradient(mass_smooth, time) * 60
+        dtg_values = _mass_loss_rate(time, mass_smooth)
     else:
         # Differentiate the raw curve, then smooth the derivative
-        dtg_raw = -np.gradient(mass, time) * 60
+        dtg_raw = _mass_loss_rate(time, mass)
         dtg_values = savgol_filter(dtg_raw, window, polyorder)
 
     return dtg_values  # type: ignore[no-any-return]
@@ -187,7 +204,8 @@ def dtg_custom(
     Returns
     -------
     np.ndarray
-        DTG values in mg/min. Positive values indicate mass loss.
+        DTG values in mg/min. Positive values indicate mass loss. float32
+        ``mass`` input stays float32; anything else yields float64.
 
     Raises
     ------
@@ -225,13 +243,16 @@ def dtg_custom(
     if polyorder >= window:
         raise ValueError(f"polyorder ({polyorder}) must be less than window ({window})")
 
+    # Deferred import, as in dtg()
+    from scipy.signal import savgol_filter
+
     if method == "savgol":
         # Smooth the mass curve, then differentiate (in mg/min)
         mass_smooth = savgol_filter(mass, window, polyorder)
-        dtg_values = -np.gradient(mass_smooth, time) * 60
+        dtg_values = _mass_loss_rate(time, mass_smooth)
     else:
         # Differentiate the raw curve, then smooth the derivative
-        dtg_raw = -np.gradient(mass, time) * 60
+        dtg_raw = _mass_loss_rate(time, mass)
         dtg_values = savgol_filter(dtg_raw, window, polyorder)
 
     return dtg_values  # type: ignore[no-any-return]
@@ -7,13 +7,17 @@ and mass normalization on PyArrow tables.
 
 import json
 import logging
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any
 
 import numpy as np
-import polars as pl
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from ..analysis import dtg
-from ..util import get_column_metadata, set_column_metadata, with_polars
+from ..util import encode_metadata, get_column_metadata
 
 __all__ = [
     "add_dtg",
@@ -33,6 +37,27 @@ logger.addHandler(logging.NullHandler())
 MIN_DSC_SENSITIVITY_UV_PER_MW = 1e-2
 
 
+def _freeze(value: Any) -> Any:
+    """Read-only copy of decoded JSON: mappings become proxies, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@lru_cache(maxsize=128)
+def _parse_file_metadata(metadata_bytes: bytes) -> Mapping[str, Any]:
+    """Decode the ``file_metadata`` schema entry, memoised on its bytes.
+
+    The cached result is shared by every later call on the same bytes, so it
+    is frozen all the way down; an in-place edit raises instead of leaking
+    into other callers.
+    """
+    metadata: Mapping[str, Any] = _freeze(json.loads(metadata_bytes.decode()))
+    return metadata
+
+
 def add_dtg(
     table: pa.Table,
     method: str = "savgol",
@@ -60,7 +85,8 @@ def add_dtg(
     Returns
     -------
     pa.Table
-        New table with added DTG column and preserved metadata
+        New table with added DTG column and preserved metadata. The DTG
+        column is float32 when 'mass' is float32 and float64 otherwise.
 
     Raises
     ------
@@ -88,21 +114,29 @@ def add_dtg(
     if "mass" not in column_names:
         raise ValueError("Table must contain 'mass' column")
 
-    def _add_dtg_column(df: pl.DataFrame) -> pl.DataFrame:
-        time = df.get_column("time").to_numpy()
-        mass = df.get_column("mass").to_numpy()
-        dtg_values = dtg(time, mass, method=method, smooth=smooth)
-        return df.with_columns(pl.Series(column_name, dtg_values))
+    time = table.column("time").to_numpy()
+    mass = table.column("mass").to_numpy()
+    dtg_values = dtg(time, mass, method=method, smooth=smooth)
 
-    new_table = with_polars(table, _add_dtg_column)
-
-    # Set metadata for the new DTG column
+    # Attach the column with its metadata in one step: the existing columns
+    # are shared with the input table rather than round-tripped through Polars
     dtg_metadata = {
         "units": "mg/min",
         "processing_history": ["calculated"],
         "source": "derived",
     }
-    new_table = set_column_metadata(new_table, column_name, dtg_metadata, replace=True)
+    # dtg() keeps float32 mass in float32, so the field follows the result
+    field = pa.field(
+        column_name,
+        pa.from_numpy_dtype(dtg_values.dtype),
+        metadata=encode_metadata(dtg_metadata),
+    )
+    if column_name in column_names:
+        new_table = table.set_column(
+            table.schema.get_field_index(column_name), field, pa.array(dtg_values)
+        )
+    else:
+        new_table = table.append_column(field, pa.array(dtg_values))
 
     return new_table
 
@@ -156,20 +190,42 @@ def calculate_table_dtg(
     if "mass" not in column_names:
         raise ValueError("Table must contain 'mass' column")
 
-    # Convert to DataFrame and extract arrays
-    df = pl.from_arrow(table)
-    if not isinstance(df, pl.DataFrame):
-        raise TypeError("Failed to convert PyArrow table to Polars DataFrame")
-    time = df.get_column("time").to_numpy()
-    mass = df.get_column("mass").to_numpy()
+    # Read the two columns straight from Arrow; nothing is written back, so
+    # converting the whole table to a DataFrame would only add copies
+    time = table.column("time").to_numpy()
+    mass = table.column("mass").to_numpy()
 
     # Calculate and return DTG
     return dtg(time, mass, method=method, smooth=smooth)
 
 
+def _get_sample_mass(table: pa.Table) -> Any:
+    """Read the initial sample mass from a table's ``file_metadata``."""
+    if not table.schema.metadata:
+        raise ValueError(
+            "Table metadata is missing - cannot retrieve initial sample mass"
+        )
+
+    metadata_bytes = table.schema.metadata.get(b"file_metadata")
+    if not metadata_bytes:
+        raise ValueError("No file_metadata found in table schema")
+
+    try:
+        metadata = _parse_file_metadata(metadata_bytes)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Failed to parse table metadata: {e}") from e
+
+    sample_mass = metadata.get("sample_mass")
+    if sample_mass is None:
+        raise ValueError("sample_mass not found in metadata")
+    return sample_mass
+
+
 def normalize_to_initial_mass(
     table: pa.Table,
     columns: list[str] | None = None,
+    *,
+    sample_mass: float | None = None,
 ) -> pa.Table:
     """
     Normalize mass and DSC columns to the initial sample mass from metadata.
@@ -188,6 +244,10 @@ def normalize_to_initial_mass(
     columns : list of str, optional
         Column names to normalize. If None, defaults to ['mass', 'dsc_signal']
         if they exist in the table
+    sample_mass : float, optional
+        Initial sample mass in mg. If None, it is read from the table's
+        ``file_metadata``; callers that already hold the value can pass it
+        to skip the metadata lookup
 
     Returns
     -------
@@ -198,7 +258,8 @@ def normalize_to_initial_mass(
     Raises
     ------
     ValueError
-        If sample_mass is not found in metadata or is zero/negative
+        If sample_mass is not given and not found in metadata, or is
+        zero/negative
     KeyError
         If specified columns are not found in the table
 
@@ -220,29 +281,15 @@ def normalize_to_initial_mass(
     >>> # Normalize only specific columns
     >>> normalized_table = normalize_to_initial_mass(table, columns=['mass'])
     >>>
+    >>> # Supply the sample mass directly instead of reading it from metadata
+    >>> normalized_table = normalize_to_initial_mass(table, sample_mass=15.75)
+    >>>
     >>> # Check normalized values
     >>> df = pl.from_arrow(normalized_table)
     >>> print(f"Normalized mass: {df['mass'][0]:.6f}")  # Now in mg/mg units
     """
-    # Extract metadata from table schema
-    if not table.schema.metadata:
-        raise ValueError(
-            "Table metadata is missing - cannot retrieve initial sample mass"
-        )
-
-    metadata_bytes = table.schema.metadata.get(b"file_metadata")
-    if not metadata_bytes:
-        raise ValueError("No file_metadata found in table schema")
-
-    try:
-        metadata = json.loads(metadata_bytes.decode())
-    except (json.JSONDecodeError, UnicodeDecodeError) as e:
-        raise ValueError(f"Failed to parse table metadata: {e}") from e
-
-    # Get initial sample mass from metadata
-    sample_mass = metadata.get("sample_mass")
     if sample_mass is None:
-        raise ValueError("sample_mass not found in metadata")
+        sample_mass = _get_sample_mass(table)
 
     if not isinstance(sample_mass, (int, float)) or sample_mass <= 0:
         raise ValueError(
@@ -265,21 +312,35 @@ def normalize_to_initial_mass(
         if missing_columns:
             raise KeyError(f"Columns not found in table: {missing_columns}")
 
-    def _normalize_columns(df: pl.DataFrame) -> pl.DataFrame:
-        normalization_exprs = []
-        for col in columns:
-            if not df[col].dtype.is_numeric():
-                raise ValueError(
-                    f"Column '{col}' is not numeric and cannot be normalized"
-                )
-            # Update the column in place by dividing by sample mass
-            normalization_exprs.append((pl.col(col) / sample_mass).alias(col))
-        return df.with_columns(normalization_exprs)
-
-    new_table = with_polars(table, _normalize_columns)
-
-    # Update metadata for normalized columns
+    # Check every target on the schema before touching any data
+    schema = table.schema
+    for col in columns:
+        dtype = schema.field(col).type
+        if not (
+            pa.types.is_integer(dtype)
+            or pa.types.is_floating(dtype)
+            or pa.types.is_decimal(dtype)
+        ):
+            raise ValueError(f"Column '{col}' is not numeric and cannot be normalized")
+
+    # Divide only the target columns with Arrow compute and give each its
+    # updated metadata; the table is assembled once from the shared columns
+    arrays = table.columns
+    fields = list(schema)
     for col in columns:
+        index = schema.get_field_index(col)
+        field = schema.field(index)
+        # Float columns keep their width and integers promote to float64;
+        # Arrow has no float16 divide kernel, so half floats are widened first
+        if pa.types.is_float16(field.type):
+            arrays[index] = arrays[index].cast(pa.float64())
+        divisor_type = arrays[index].type
+        if not pa.types.is_floating(divisor_type):
+            divisor_type = pa.float64()
+        arrays[index] = pc.divide(
+            arrays[index], pa.scalar(sample_mass, type=divisor_type)
+        )
+
         # Get original column metadata
         original_metadata = get_column_metadata(table, col) or {}
 
@@ -297,7 +358,13 @@ def normalize_to_initial_mass(
             ],  # Add processing step
         }
 
-        new_table = set_column_metadata(new_table, col, updated_metadata, replace=True)
+        fields[index] = field.with_type(arrays[index].type).with_metadata(
+            encode_metadata(updated_metadata)
+        )
+
+    new_table = pa.Table.from_arrays(
+        arrays, schema=pa.schema(fields, metadata=schema.metadata)
+    )
 
     return new_table
 
@@ -392,7 +459,7 @@ def apply_dsc_calibration(
         raise ValueError("No file_metadata found in table schema")
 
     try:
-        metadata = json.loads(metadata_bytes.decode())
+        metadata = _parse_file_metadata(metadata_bytes)
     except (json.JSONDecodeError, UnicodeDecodeError) as e:
         raise ValueError(f"Failed to parse table metadata: {e}") from e
 
@@ -420,39 +487,34 @@ def apply_dsc_calibration(
             "Invalid calibration constants: p1 (temperature scale) is zero"
         )
 
-    def _calibrate_dsc(df: pl.DataFrame) -> pl.DataFrame:
-        temperature = df.get_column(temperature_column).to_numpy()
-        dsc_signal = df.get_column(dsc_column).to_numpy()
-
-        # Calculate calibration factor using the formula
-        # z = (T - P0) / P1
-        z = (temperature - P0) / P1
-
-        # y = (P2 + P3*z + P4*z^2 + P5*z^3) * exp(-z^2)
-        y = (P2 + P3 * z + P4 * z**2 + P5 * z**3) * np.exp(-(z**2))
-
-        # Apply calibration: calibrated_signal = dsc_signal_uV / y (µV to mW)
-        # where y is sensitivity in µV/mW, so µV ÷ (µV/mW) = mW.
-        # Only where the sensitivity is meaningfully positive; elsewhere NaN.
-        valid = y > MIN_DSC_SENSITIVITY_UV_PER_MW  # False for NaN temps too
-        if not valid.all():
-            bad_temps = temperature[~valid]
-            logger.warning(
-                f"DSC sensitivity is below {MIN_DSC_SENSITIVITY_UV_PER_MW} µV/mW "
-                f"for {int((~valid).sum())} of {len(y)} samples (temperatures "
-                f"{np.nanmin(bad_temps):.1f}-{np.nanmax(bad_temps):.1f} °C are "
-                "outside the calibration's valid range); calibrated DSC set to "
-                "NaN there"
-            )
-        calibrated_dsc = np.full(len(dsc_signal), np.nan)
-        calibrated_dsc[valid] = dsc_signal[valid] / y[valid]
-
-        return df.with_columns(pl.Series(dsc_column, calibrated_dsc))
-
-    new_table = with_polars(table, _calibrate_dsc)
+    temperature = table.column(temperature_column).to_numpy()
+    dsc_signal = table.column(dsc_column).to_numpy()
+
+    # Calculate calibration factor using the formula
+    # z = (T - P0) / P1
+    z = (temperature - P0) / P1
+
+    # y = (P2 + P3*z + P4*z^2 + P5*z^3) * exp(-z^2)
+    y = (P2 + P3 * z + P4 * z**2 + P5 * z**3) * np.exp(-(z**2))
+
+    # Apply calibration: calibrated_signal = dsc_signal_uV / y (µV to mW)
+    # where y is sensitivity in µV/mW, so µV ÷ (µV/mW) = mW.
+    # Only where the sensitivity is meaningfully positive; elsewhere NaN.
+    valid = y > MIN_DSC_SENSITIVITY_UV_PER_MW  # False for NaN temps too
+    if not valid.all():
+        bad_temps = temperature[~valid]
+        logger.warning(
+            f"DSC sensitivity is below {MIN_DSC_SENSITIVITY_UV_PER_MW} µV/mW "
+            f"for {int((~valid).sum())} of {len(y)} samples (temperatures "
+            f"{np.nanmin(bad_temps):.1f}-{np.nanmax(bad_temps):.1f} °C are "
+            "outside the calibration's valid range); calibrated DSC set to "
+            "NaN there"
+        )
+    calibrated_dsc = np.full(len(dsc_signal), np.nan)
+    calibrated_dsc[valid] = dsc_signal[valid] / y[valid]
 
     # Update metadata for the calibrated DSC column
-    original_dsc_metadata = get_column_metadata(table, dsc_column) or {}
+    original_dsc_metadata = dsc_metadata or {}
 
     # Determine appropriate units based on current state
     current_units = original_dsc_metadata.get("units", "µV")
@@ -471,8 +533,13 @@ def apply_dsc_calibration(
         "calibration_applied": True,  # Add calibration flag
     }
 
-    new_table = set_column_metadata(
-        new_table, dsc_column, updated_dsc_metadata, replace=True
+    # Swap only the calibrated column, with its new metadata attached; every
+    # other column and the schema metadata are carried over as-is
+    field = pa.field(
+        dsc_column, pa.float64(), metadata=encode_metadata(updated_dsc_metadata)
+    )
+    new_table = table.set_column(
+        table.schema.get_field_index(dsc_column), field, pa.array(calibrated_dsc)
     )
 
     return new_table
@@ -13,9 +13,11 @@ Three subcommands under the ``pyngb`` entry point:
 import argparse
 import json
 import logging
+import multiprocessing as mp
 import sys
 import zipfile
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -74,6 +76,13 @@ def build_parser() -> argparse.ArgumentParser:
         default="sample_temperature",
         help="Axis for dynamic segment alignment during baseline subtraction (default: sample_temperature)",
     )
+    convert.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of files to convert in parallel worker processes (default: 1)",
+    )
 
     inspect = sub.add_parser(
         "inspect",
@@ -229,12 +238,12 @@ def write_output_files(
     """
     if output_format in ("parquet", "both"):
         parquet_file = output_path / f"{base_name}.parquet"
-        pq.write_table(data, parquet_file, compression="snappy")
+        pq.write_table(data, parquet_file, compression="zstd")
         logger.debug(f"Wrote Parquet file: {parquet_file}")
 
     if output_format in ("csv", "both"):
-        # Optimize: Only convert to Polars when needed for CSV output
-        df = pl.from_arrow(data)
+        # rechunk=False wraps the Arrow buffers without copying
+        df = pl.from_arrow(data, rechunk=False)
         # Ensure we have a DataFrame for CSV writing
         if isinstance(df, pl.DataFrame):
             csv_file = output_path / f"{base_name}.csv"
@@ -287,6 +296,44 @@ def process_file(
         logger.info(f"Successfully parsed {input_file}")
 
 
+def _convert_file(
+    input_file: str,
+    output_path: Path,
+    output_format: str,
+    baseline_file: str | None,
+    dynamic_axis: str,
+    run: str,
+) -> str | None:
+    """Convert one file, returning an error message instead of raising.
+
+    Module-level so it can run in a worker process; the message is returned
+    so the parent logs every failure, in input order, for both code paths.
+    """
+    try:
+        process_file(
+            input_file, output_path, output_format, baseline_file, dynamic_axis, run
+        )
+    except zipfile.BadZipFile:
+        return f"{input_file} is not a valid NGB file (not a ZIP archive)"
+    except (FileNotFoundError, ValueError, PermissionError) as e:
+        return str(e)
+    except NGBParseError as e:
+        return f"Failed to parse {input_file}: {e}"
+    except OSError as e:
+        return f"OS error while processing file {input_file}: {e}"
+    return None
+
+
+def _init_worker_logging(level: int) -> None:
+    """Configure logging in a spawned worker the way main() does in the parent.
+
+    Spawned processes start with an unconfigured root logger, and pyngb's
+    loggers only carry a NullHandler, so without this every worker record
+    (progress, parser warnings, -v debug output) would be dropped.
+    """
+    logging.basicConfig(level=level)
+
+
 def cmd_convert(args: argparse.Namespace) -> int:
     """Run the convert subcommand: parse files and write outputs."""
     # Validate shared inputs once; failures here abort the whole run.
@@ -296,6 +343,8 @@ def cmd_convert(args: argparse.Namespace) -> int:
                 f"--run {args.run} cannot be combined with --baseline: the "
                 "embedded correction run is the baseline"
             )
+        if args.jobs < 1:
+            raise ValueError(f"--jobs must be at least 1, got {args.jobs}")
         if args.baseline:
             validate_baseline_file(Path(args.baseline))
         output_path = Path(args.output)
@@ -305,28 +354,29 @@ def cmd_convert(args: argparse.Namespace) -> int:
         return 1
 
     # Per-file failures don't stop the remaining files.
+    shared = (output_path, args.format, args.baseline, args.dynamic_axis, args.run)
+    jobs = min(args.jobs, len(args.input))
+    if jobs > 1:
+        # Spawn, as in BatchProcessor: forking a process that already holds
+        # PyArrow/Polars thread pools is not safe.
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker_logging,
+            initargs=(logging.getLogger().getEffectiveLevel(),),
+        ) as executor:
+            futures = [
+                executor.submit(_convert_file, input_file, *shared)
+                for input_file in args.input
+            ]
+            errors = [future.result() for future in futures]
+    else:
+        errors = [_convert_file(input_file, *shared) for input_file in args.input]
+
     failures = 0
-    for input_file in args.input:
-        try:
-            process_file(
-                input_file,
-                output_path,
-                args.format,
-                args.baseline,
-                args.dynamic_axis,
-                args.run,
-            )
-        except zipfile.BadZipFile:
-            logger.error(f"{input_file} is not a valid NGB file (not a ZIP archive)")
-            failures += 1
-        except (FileNotFoundError, ValueError, PermissionError) as e:
-            logger.error(str(e))
-            failures += 1
-        except NGBParseError as e:
-            logger.error(f"Failed to parse {input_file}: {e}")
-            failures += 1
-        except OSError as e:
-            logger.error(f"OS error while processing file {input_file}: {e}")
+    for error in errors:
+        if error is not None:
+            logger.error(error)
             failures += 1
 
     if failures:
@@ -513,7 +563,7 @@ def main(argv: list[str] | None = None) -> int:
     """Command-line interface for pyngb.
 
     Usage:
-        pyngb convert FILE... [-o DIR] [-f parquet|csv|both] [-b BASELINE] [--run sample|correction|corrected]
+        pyngb convert FILE... [-o DIR] [-f parquet|csv|both] [-b BASELINE] [--run sample|correction|corrected] [-j N]
         pyngb inspect FILE... [--stream N] [--values] [--unknown] [--coverage] [--json]
         pyngb validate FILE... [--json]
 
@@ -527,6 +577,9 @@ def main(argv: list[str] | None = None) -> int:
         # Baseline-subtract every input against the same baseline
         pyngb convert *.ngb-ss3 -b baseline.ngb-bs3
 
+        # Convert a directory of files four at a time
+        pyngb convert *.ngb-ss3 -j 4
+
         # Sample + Correction files: raw sample run, embedded correction run,
         # or corrected curves (subtract the file's own embedded correction)
         pyngb convert run.ngb-ds3
@@ -11,8 +11,13 @@ import pyarrow as pa
 from ..baseline import BaselineSubtractor
 from ..config import ParsingConfig
 from ..constants import FileMetadata
-from ..exceptions import NGBStreamNotFoundError
-from ..format import build_dataframe, build_metadata, count_runs, load_document
+from ..format import (
+    NGBDocument,
+    build_dataframe,
+    build_metadata,
+    count_runs,
+    load_document,
+)
 from ..util import get_hash, initialize_table_column_metadata, set_metadata
 from .metadata import mark_baseline_corrected
 
@@ -31,16 +36,15 @@ def _load(path: str | Path, limits: ParsingConfig | None):
 
     Loader policy: streams 1 and 2 are required, stream 3 is optional.
     """
-    try:
-        return load_document(path, streams=(1, 2, 3), limits=limits)
-    except NGBStreamNotFoundError:
-        # Stream 3 is optional; if 1 or 2 is the one missing, this second
-        # request raises again with the accurate message.
-        return load_document(path, streams=(1, 2), limits=limits)
+    return load_document(path, streams=(1, 2), optional=(3,), limits=limits)
 
 
 def _parse(
-    path: str | Path, limits: ParsingConfig | None, run: str = "sample"
+    path: str | Path,
+    limits: ParsingConfig | None,
+    run: str = "sample",
+    *,
+    doc: NGBDocument | None = None,
 ) -> tuple[FileMetadata, pl.DataFrame]:
     """Parse metadata and one measurement run through the document layer.
 
@@ -52,8 +56,12 @@ def _parse(
     correction and raises on files that carry none. The metadata is
     file-level and always describes the sample measurement (the correction's
     provenance is recorded in its ``correction_file_path`` key).
+
+    ``doc`` is an already-loaded document of ``path``, to reuse instead of
+    parsing the file again.
     """
-    doc = _load(path, limits)
+    if doc is None:
+        doc = _load(path, limits)
     run_index = _RUNS.index(run)
     if run_index > 0 and count_runs(doc) < 2:
         raise ValueError(
@@ -64,7 +72,11 @@ def _parse(
 
 
 def _parse_baseline(
-    path: str | Path, limits: ParsingConfig | None, *, require_embedded: bool = False
+    path: str | Path,
+    limits: ParsingConfig | None,
+    *,
+    require_embedded: bool = False,
+    doc: NGBDocument | None = None,
 ) -> tuple[FileMetadata, pl.DataFrame]:
     """Parse a file *as a baseline*: the correction curves it provides.
 
@@ -76,9 +88,11 @@ def _parse_baseline(
 
     ``require_embedded`` demands an embedded correction run (the
     ``run="corrected"`` path, where the file must be its own baseline);
-    without it a single-run file contributes its only run.
+    without it a single-run file contributes its only run. ``doc`` is reused
+    as in :func:`_parse`.
     """
-    doc = _load(path, limits)
+    if doc is None:
+        doc = _load(path, limits)
     n_runs = count_runs(doc)
     if require_embedded and n_runs < 2:
         raise ValueError(
@@ -310,12 +324,15 @@ def read_ngb(
             "embedded correction run is the baseline"
         )
     # "corrected" is the sample run baseline-subtracted against the file's
-    # own embedded correction — the file is its own baseline.
+    # own embedded correction — the file is its own baseline, so its
+    # document is loaded once and serves both halves.
     self_correct = run == "corrected"
+    doc = None
     if self_correct:
         baseline_file = path
+        doc = _load(path, limits)
 
-    metadata, data_df = _parse(path, limits, "sample" if self_correct else run)
+    metadata, data_df = _parse(path, limits, "sample" if self_correct else run, doc=doc)
 
     # Add file hash to metadata
     file_hash = get_hash(path)
@@ -329,7 +346,7 @@ def read_ngb(
     # Handle baseline subtraction if requested
     if baseline_file is not None:
         baseline_metadata, baseline_df = _parse_baseline(
-            baseline_file, limits, require_embedded=self_correct
+            baseline_file, limits, require_embedded=self_correct, doc=doc
         )
         data_df = BaselineSubtractor().process_baseline_subtraction(
             data_df, baseline_df, metadata, baseline_metadata, dynamic_axis
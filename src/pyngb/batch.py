@@ -4,7 +4,10 @@ Batch processing tools for handling multiple NGB files.
 
 from __future__ import annotations
 
+import fnmatch
+import json
 import logging
+import os
 import time
 import zipfile
 import multiprocessing as mp
@@ -57,9 +60,24 @@ DEFAULT_PATTERNS: tuple[str, ...] = ("*.ngb-ss3", "*.ngb-ds3")
 
 def _matching_files(directory: Path, pattern: str | Sequence[str]) -> list[Path]:
     """Files under ``directory`` matching one pattern or any of several."""
+    if not directory.is_dir():
+        # Like Path.glob, a missing directory simply matches nothing
+        return []
     patterns = (pattern,) if isinstance(pattern, str) else tuple(pattern)
+    # Plain name patterns are answered from one scandir pass instead of one
+    # directory listing per pattern; anything path-like or recursive keeps
+    # pathlib's glob semantics.
+    flat = [p for p in patterns if "/" not in p and os.sep not in p and "**" not in p]
+    nested = [p for p in patterns if p not in flat]
     matched: set[Path] = set()
-    for entry in patterns:
+    if flat:
+        with os.scandir(directory) as entries:
+            matched.update(
+                directory / entry.name
+                for entry in entries
+                if any(fnmatch.fnmatch(entry.name, p) for p in flat)
+            )
+    for entry in nested:
         matched.update(directory.glob(entry))
     return sorted(matched)
 
@@ -75,8 +93,6 @@ def _process_single_file_worker(
     Using a module-level function avoids pickling bound methods and reduces
     fork-related issues with libraries like PyArrow/Polars when using processes.
     """
-    import json
-
     start_time = time.perf_counter()
     file_p = Path(file_path)
     out_dir = Path(output_dir)
@@ -92,12 +108,12 @@ def _process_single_file_worker(
             new_meta = {**existing_meta, b"file_metadata": metadata_json.encode()}
             table_with_meta = data.replace_schema_metadata(new_meta)
             pq.write_table(
-                table_with_meta, out_dir / f"{base_name}.parquet", compression="snappy"
+                table_with_meta, out_dir / f"{base_name}.parquet", compression="zstd"
             )
 
         if output_format in ("csv", "both"):
-            # Optimize: Only convert to Polars when needed for CSV output
-            df = pl.from_arrow(data)
+            # rechunk=False wraps the Arrow buffers without copying
+            df = pl.from_arrow(data, rechunk=False)
             if isinstance(df, pl.Series):
                 df = pl.DataFrame(df)
             df.write_csv(out_dir / f"{base_name}.csv")
@@ -537,24 +553,20 @@ class NGBDataset:
         Returns:
             DataFrame with flattened data suitable for CSV export
         """
-        import json
-
-        # Create a new dataframe with flattened columns
-        flattened_data = []
-
-        for row in df.iter_rows(named=True):
-            flattened_row = {}
-            for key, value in row.items():
-                if isinstance(value, (dict, list)):
-                    # Convert nested structures to JSON strings
-                    flattened_row[key] = (
-                        json.dumps(value) if value is not None else None
-                    )
-                else:
-                    flattened_row[key] = value
-            flattened_data.append(flattened_row)
-
-        return pl.DataFrame(flattened_data)
+        # Only nested columns need work; scalar columns pass through as-is
+        # instead of being rebuilt row by row
+        nested = [name for name, dtype in df.schema.items() if dtype.is_nested()]
+        return df.with_columns(
+            pl.Series(
+                name,
+                [
+                    json.dumps(value) if value is not None else None
+                    for value in df.get_column(name).to_list()
+                ],
+                dtype=pl.String,
+            )
+            for name in nested
+        )
 
     def filter_by_metadata(
         self, predicate: Callable[[FileMetadata], bool]
@@ -145,15 +145,23 @@ def count_runs(doc: NGBDocument) -> int:
 
 
 def _assemble_stream(
-    doc: NGBDocument, stream_id: int, run: int, frame: pl.DataFrame
-) -> pl.DataFrame:
+    doc: NGBDocument,
+    stream_id: int,
+    run: int,
+    columns: dict[str, npt.NDArray[np.float64]],
+) -> None:
+    """Add one stream's channels of ``run`` to ``columns``, in stream order.
+
+    Columns are collected as arrays and the frame is built once by the
+    caller, so no channel triggers a rebuild of the ones before it.
+    """
     runs = _split_runs(doc.tables_of(stream_id))
     tables = runs[run] if run < len(runs) else ()
     chunks: list[npt.NDArray[np.float64]] = []
     title: str | None = None
 
-    def flush() -> pl.DataFrame:
-        nonlocal chunks, frame
+    def flush() -> None:
+        nonlocal chunks
         if chunks:
             values = np.concatenate(chunks)
             if title is None:
@@ -162,28 +170,28 @@ def _assemble_stream(
                     "any channel header",
                     stream=stream_id,
                 )
-            if title in frame.columns:
+            if title in columns:
                 logger.warning(
                     f"Channel '{title}' appears more than once; "
                     "overwriting the earlier column"
                 )
             if title == "time":
                 values = _minutes_to_seconds(values)
-            if frame.width and len(values) != frame.height:
+            height = len(next(iter(columns.values()))) if columns else None
+            if height is not None and len(values) != height:
                 raise NGBCorruptedFileError(
                     f"channel '{title}' has {len(values)} values but the "
-                    f"frame has {frame.height} rows",
+                    f"frame has {height} rows",
                     stream=stream_id,
                     declared=len(values),
-                    available=frame.height,
+                    available=height,
                 )
-            frame = frame.with_columns(pl.Series(name=title, values=values))
+            columns[title] = values
         chunks = []
-        return frame
 
     for table in tables:
         if table.type_ref == CHANNEL_HEADER_TYPE:
-            frame = flush()
+            flush()
             title = channel_name(table.category)
         elif table.type_ref == SEGMENT_VALUES_TYPE:
             values = _data_array(table)
@@ -200,7 +208,7 @@ def _assemble_stream(
 
     # Real files end with a data-less trailing header, but a stream must not
     # depend on it to emit its last column.
-    return flush()
+    flush()
 
 
 def build_dataframe(doc: NGBDocument, *, run: int = 0) -> pl.DataFrame:
@@ -241,8 +249,8 @@ def build_dataframe(doc: NGBDocument, *, run: int = 0) -> pl.DataFrame:
             f"run {run} requested but the file contains {n_runs} measurement run(s)"
         )
 
-    frame = pl.DataFrame()
+    columns: dict[str, npt.NDArray[np.float64]] = {}
     for stream_id in _DATA_STREAMS:
         if stream_id in doc.streams:
-            frame = _assemble_stream(doc, stream_id, run, frame)
-    return frame
+            _assemble_stream(doc, stream_id, run, columns)
+    return pl.DataFrame(columns)
@@ -204,20 +204,21 @@ def _member_name(stream_id: int) -> str:
     return f"{_STREAM_PREFIX}{stream_id}{_STREAM_SUFFIX}"
 
 
-def _available_streams(archive: zipfile.ZipFile) -> list[int]:
-    ids = []
+def _available_streams(archive: zipfile.ZipFile) -> set[int]:
+    ids = set()
     for name in archive.namelist():
         if name.startswith(_STREAM_PREFIX) and name.endswith(_STREAM_SUFFIX):
             middle = name[len(_STREAM_PREFIX) : -len(_STREAM_SUFFIX)]
             if middle.isdigit():
-                ids.append(int(middle))
-    return sorted(ids)
+                ids.add(int(middle))
+    return ids
 
 
 def open_ngb(
     path: str | Path,
     *,
     streams: Iterable[int] | None = None,
+    optional: Iterable[int] = (),
     limits: ParsingConfig | None = None,
 ) -> dict[int, StreamData]:
     """Read stream blobs from an NGB archive and validate their containers.
@@ -226,6 +227,8 @@ def open_ngb(
         path: Path to the ``.ngb-*`` file.
         streams: Stream numbers to load; None loads every stream present.
             Explicitly requested streams must exist.
+        optional: Further stream numbers to load only if present, so a
+            caller with optional streams needs a single archive open.
         limits: Resource limits; each member's declared decompressed size is
             checked against ``max_stream_size_mb`` before decompression (the
             ZIP directory's declared size is authoritative: zipfile never
@@ -247,12 +250,15 @@ def open_ngb(
 
     with _translated_errors(path), zipfile.ZipFile(path, "r") as archive:
         available = _available_streams(archive)
-        wanted = available if streams is None else sorted(set(streams))
+        wanted = sorted(available if streams is None else set(streams))
         missing = [sid for sid in wanted if sid not in available]
         if missing:
             raise NGBStreamNotFoundError(
                 f"Missing required streams: {[_member_name(sid) for sid in missing]}"
             )
+        extra = [sid for sid in optional if sid in available and sid not in wanted]
+        if extra:
+            wanted = sorted({*wanted, *extra})
         loaded: dict[int, StreamData] = {}
         for stream_id in wanted:
             name = _member_name(stream_id)
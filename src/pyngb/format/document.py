@@ -128,12 +128,26 @@ class NGBDocument:
     tables: dict[int, tuple[Table, ...]]
     spans: dict[int, tuple[UnknownSpan, ...]]
     orphans: dict[int, tuple[Field, ...]]
+    # Per-stream {category: tables in stream order}, built on first lookup.
+    _categories: dict[int, dict[int, tuple[Table, ...]]] = dataclass_field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def tables_of(self, stream_id: int) -> tuple[Table, ...]:
         return self.tables.get(stream_id, ())
 
+    def _in_category(self, stream_id: int, category: int) -> tuple[Table, ...]:
+        index = self._categories.get(stream_id)
+        if index is None:
+            grouped: dict[int, list[Table]] = {}
+            for table in self.tables_of(stream_id):
+                grouped.setdefault(table.category, []).append(table)
+            index = {cat: tuple(tables) for cat, tables in grouped.items()}
+            self._categories[stream_id] = index
+        return index.get(category, ())
+
     def by_category(self, stream_id: int, category: int) -> Iterator[Table]:
-        return (t for t in self.tables_of(stream_id) if t.category == category)
+        return iter(self._in_category(stream_id, category))
 
     def find(
         self,
@@ -144,13 +158,16 @@ class NGBDocument:
         with_fields: Iterable[int] = (),
     ) -> Iterator[Table]:
         """Tables of a stream, in stream order, matching every given filter."""
-        required = tuple(with_fields)
-        for table in self.tables_of(stream_id):
-            if category is not None and table.category != category:
-                continue
+        required = frozenset(with_fields)
+        tables = (
+            self.tables_of(stream_id)
+            if category is None
+            else self._in_category(stream_id, category)
+        )
+        for table in tables:
             if type_ref is not None and table.type_ref != type_ref:
                 continue
-            if required and not table.has_fields(*required):
+            if required and not table.fields.keys() >= required:
                 continue
             yield table
 
@@ -337,6 +354,7 @@ def load_document(
     path: str | Path,
     *,
     streams: Iterable[int] | None = None,
+    optional: Iterable[int] = (),
     limits: ParsingConfig | None = None,
 ) -> NGBDocument:
     """Parse an NGB file into its full document model.
@@ -344,6 +362,7 @@ def load_document(
     Args:
         path: Path to the ``.ngb-*`` file.
         streams: Stream numbers to load; None loads every stream present.
+        optional: Further stream numbers to load only if present.
         limits: Resource limits (stream size, array size, table count).
 
     Raises:
@@ -353,7 +372,7 @@ def load_document(
         NGBResourceLimitError: A declared size exceeds the configured limits.
     """
     limits = limits or ParsingConfig()
-    loaded = open_ngb(path, streams=streams, limits=limits)
+    loaded = open_ngb(path, streams=streams, optional=optional, limits=limits)
     tables: dict[int, tuple[Table, ...]] = {}
     spans: dict[int, tuple[UnknownSpan, ...]] = {}
     orphans: dict[int, tuple[Field, ...]] = {}
@@ -21,7 +21,7 @@ from __future__ import annotations
 
 import logging
 import re
-from collections.abc import Callable, Iterator
+from collections.abc import Callable
 from datetime import datetime, timezone
 from itertools import islice
 
@@ -110,15 +110,34 @@ def _numeric(value: object) -> float | None:
     return None
 
 
+#: FIELD_MAP's field ids grouped by category, for the single-sweep lookup.
+_FIELD_MAP_IDS: dict[int, frozenset[int]] = {
+    category: frozenset(m.field_id for m in FIELD_MAP if m.category == category)
+    for category in {m.category for m in FIELD_MAP}
+}
+
+
 def _apply_field_map(doc: NGBDocument, metadata: FileMetadata) -> None:
-    """First stream-1 table of the category carrying the field wins."""
+    """First stream-1 table of the category carrying the field wins.
+
+    Every mapped (category, field) pair is resolved in one sweep over the
+    stream rather than one scan per FIELD_MAP entry.
+    """
+    first: dict[tuple[int, int], Table] = {}
+    for table in doc.tables_of(_STREAM):
+        wanted = _FIELD_MAP_IDS.get(table.category)
+        if wanted is None:
+            continue
+        for field_id in wanted.intersection(table.fields):
+            first.setdefault((table.category, field_id), table)
+
     for meta in FIELD_MAP:
         if meta.key in metadata:
             continue
-        table = doc.first(_STREAM, category=meta.category, with_fields=(meta.field_id,))
-        if table is None:
+        source = first.get((meta.category, meta.field_id))
+        if source is None:
             continue
-        value = meta.convert(table.value(meta.field_id))
+        value = meta.convert(source.value(meta.field_id))
         if value is not None:
             metadata[meta.key] = value  # type: ignore[literal-required]
 
@@ -453,22 +472,18 @@ def extract_calibration_constants(doc: NGBDocument, metadata: FileMetadata) -> N
 # -- Temperature calibration ------------------------------------------------------------
 
 
-def _string_fields_ending_in(table: Table, suffix: str) -> Iterator[str]:
-    for entry in table.fields.values():
-        if (
-            entry.dtype == DType.STRING
-            and isinstance(entry.value, str)
-            and entry.value.endswith(suffix)
-        ):
-            yield entry.value
-
-
 def _find_record_table(doc: NGBDocument, suffix: str) -> tuple[Table, str] | None:
-    """The calibration-source table whose record path ends in ``suffix``."""
+    """The calibration-source table whose record path ends in ``suffix``.
+
+    A flat scan: the dtype check rejects non-string fields before their
+    value is touched, and no generator is built per table.
+    """
     for table in doc.tables_of(_STREAM):
-        path = next(_string_fields_ending_in(table, suffix), None)
-        if path is not None:
-            return table, path
+        for entry in table.fields.values():
+            if entry.dtype == DType.STRING:
+                value = entry.value
+                if isinstance(value, str) and value.endswith(suffix):
+                    return table, value
     return None
 
 
@@ -665,18 +680,25 @@ def extract_app_license(doc: NGBDocument, metadata: FileMetadata) -> None:
         # Fallback: the category assumption failed; apply the same selection
         # rules over every stream-1 string field.
         strings = [text for table in doc.tables_of(_STREAM) for text in table.strings()]
-    if not strings:
-        return
 
-    app = next((s for s in strings if _VERSION_RE.match(s)), None)
+    # One pass for both rules: the first version banner, and the longest
+    # multi-line non-banner string (first wins a tie, as max() would).
+    app: str | None = None
+    licensed: str | None = None
+    for text in strings:
+        if app is None and _VERSION_RE.match(text):
+            app = text
+        if (
+            "\n" in text
+            and (licensed is None or len(text) > len(licensed))
+            and not text.lstrip().startswith("Version")
+        ):
+            licensed = text
+
     if app and "application_version" not in metadata:
         metadata["application_version"] = app
-
-    license_candidates = [
-        s for s in strings if "\n" in s and not s.lstrip().startswith("Version")
-    ]
-    if license_candidates and "licensed_to" not in metadata:
-        metadata["licensed_to"] = max(license_candidates, key=len)
+    if licensed is not None and "licensed_to" not in metadata:
+        metadata["licensed_to"] = licensed
 
 
 # -- Entry point ---------------------------------------------------------------------------------
@@ -112,7 +112,6 @@ TABLE_OPEN_TAG: Final = b"\x02\x00\x00\x80"
 _PROLOGUE_MAGIC: Final = b"\x02\x00\x00\x80"
 
 _MODE_SCALAR_BYTES: Final = b"\x80\x01"
-_MODE_ARRAY_BYTES: Final = b"\xa0\x01"
 _MODE_PREAMBLE_BYTES: Final = b"\x00\x01"
 
 # REF payloads are short and structured (10 bytes for a back-reference open,
@@ -267,14 +266,16 @@ def decode_scalar(
     unknown ones return the raw bytes."""
     if dtype == DType.NULL:
         return None
+    # unpack_from reads the view in place; slicing first would allocate a
+    # new memoryview per record.
     if dtype == DType.U16:
-        return int(_U16.unpack(payload[:2])[0])
+        return int(_U16.unpack_from(payload)[0])
     if dtype == DType.I32:
-        return int(_I32.unpack(payload[:4])[0])
+        return int(_I32.unpack_from(payload)[0])
     if dtype == DType.F32:
-        return float(_F32.unpack(payload[:4])[0])
+        return float(_F32.unpack_from(payload)[0])
     if dtype == DType.F64:
-        return float(_F64.unpack(payload[:8])[0])
+        return float(_F64.unpack_from(payload)[0])
     if dtype == DType.U8:
         return payload[0]
     if dtype == DType.STRING:
@@ -387,10 +388,15 @@ def _parse_record(
         return None
     if not data.startswith(_FIXED_MIDDLE, pos + 9):
         return None
+    # Mode bytes as ints: 80 01 (scalar) / a0 01 (array); one index each
+    # instead of a startswith call per candidate mode.
+    if data[pos + 23] != 0x01:
+        return None
+    mode = data[pos + 22]
     dtype = data[pos + 21]
     value_start = pos + 24
 
-    if data.startswith(_MODE_SCALAR_BYTES, pos + 22):
+    if mode == 0x80:  # Mode.SCALAR
         if dtype == 0x1F:  # DType.STRING
             if value_start + 4 > end:
                 return None
@@ -426,7 +432,7 @@ def _parse_record(
             ),
         )
 
-    if data.startswith(_MODE_ARRAY_BYTES, pos + 22):
+    if mode == 0xA0:  # Mode.ARRAY
         item_size = ITEM_SIZE.get(dtype)
         if item_size is None or value_start + 4 > end:
             return None
@@ -11,6 +11,7 @@ All functions are re-exported from submodules for backward compatibility.
 # Import from submodules
 from .columns import (
     add_processing_step,
+    encode_metadata,
     get_baseline_status,
     get_column_metadata,
     initialize_table_column_metadata,
@@ -26,6 +27,7 @@ from .metadata import set_metadata
 __all__ = [
     # Column metadata
     "add_processing_step",
+    "encode_metadata",
     "get_baseline_status",
     "get_column_metadata",
     # Hashing
@@ -8,11 +8,13 @@ from typing import Any
 import polars as pl
 import pyarrow as pa
 
+from ..constants import DEFAULT_COLUMN_METADATA, FIELD_APPLICABILITY
+
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
 
-def _encode_metadata(metadata: dict[str, Any]) -> dict[bytes, bytes]:
+def encode_metadata(metadata: dict[str, Any]) -> dict[bytes, bytes]:
     """Encode a metadata dict into the bytes->bytes form Arrow fields require.
 
     Strings are UTF-8 encoded, bytes pass through, everything else is JSON.
@@ -52,7 +54,7 @@ def set_column_metadata(
     if replace:
         # Schema.set swaps one field and keeps schema-level metadata intact
         i = table.schema.get_field_index(column)
-        field = table.schema.field(i).with_metadata(_encode_metadata(metadata))
+        field = table.schema.field(i).with_metadata(encode_metadata(metadata))
         return table.cast(table.schema.set(i, field))
     # For merging, manually merge and then replace
     existing = get_column_metadata(table, column) or {}
@@ -172,8 +174,6 @@ def get_baseline_status(table: pa.Table, column: str) -> bool | None:
     Raises:
         ValueError: If column doesn't exist in table
     """
-    from ..constants import FIELD_APPLICABILITY
-
     if column not in table.column_names:
         raise ValueError(f"Column '{column}' not found in table")
 
@@ -194,8 +194,6 @@ def is_baseline_correctable(column_name: str) -> bool:
     Returns:
         True if column supports baseline correction
     """
-    from ..constants import FIELD_APPLICABILITY
-
     return column_name in FIELD_APPLICABILITY["baseline_subtracted"]
 
 
@@ -212,8 +210,6 @@ def set_default_column_metadata(table: pa.Table, column: str) -> pa.Table:
     Raises:
         ValueError: If column doesn't exist in table
     """
-    from ..constants import DEFAULT_COLUMN_METADATA
-
     if column not in table.column_names:
         raise ValueError(f"Column '{column}' not found in table")
 
@@ -246,8 +242,6 @@ def initialize_table_column_metadata(table: pa.Table) -> pa.Table:
     Returns:
         New table with default metadata set for all columns
     """
-    from ..constants import DEFAULT_COLUMN_METADATA
-
     fallback = {"units": "unknown", "processing_history": ["raw"], "source": "unknown"}
 
     fields = []
@@ -260,7 +254,7 @@ def initialize_table_column_metadata(table: pa.Table) -> pa.Table:
         default_metadata = DEFAULT_COLUMN_METADATA.get(column, fallback)
         if not isinstance(default_metadata, dict):
             default_metadata = fallback
-        fields.append(field.with_metadata(_encode_metadata(default_metadata)))
+        fields.append(field.with_metadata(encode_metadata(default_metadata)))
         changed = True
 
     if not changed:
@@ -291,15 +285,11 @@ def with_polars(
 
     new_table = fn(df).to_arrow()
 
-    if table.schema.metadata:
-        new_table = new_table.replace_schema_metadata(table.schema.metadata)
-
-    for col in table.column_names:
-        if col in new_table.column_names:
-            original_metadata = get_column_metadata(table, col)
-            if original_metadata:
-                new_table = set_column_metadata(
-                    new_table, col, original_metadata, replace=True
-                )
-
-    return new_table
+    # Carry the original field metadata over as-is and rebuild the schema
+    # once, rather than decoding and re-setting it column by column
+    original = {field.name: field.metadata for field in table.schema}
+    fields = [
+        field.with_metadata(original[field.name]) if original.get(field.name) else field
+        for field in new_table.schema
+    ]
+    return new_table.cast(pa.schema(fields, metadata=table.schema.metadata))
@@ -4,7 +4,7 @@ from typing import Any
 
 import pyarrow as pa
 
-from .columns import _encode_metadata
+from .columns import encode_metadata
 
 
 def set_metadata(
@@ -36,10 +36,10 @@ def set_metadata(
         i = schema.get_field_index(col)
         if i == -1:
             continue
-        merged = {**(schema.field(i).metadata or {}), **_encode_metadata(meta)}
+        merged = {**(schema.field(i).metadata or {}), **encode_metadata(meta)}
         schema = schema.set(i, schema.field(i).with_metadata(merged))
     if tbl_meta:
-        merged = {**(schema.metadata or {}), **_encode_metadata(tbl_meta)}
+        merged = {**(schema.metadata or {}), **encode_metadata(tbl_meta)}
         schema = schema.with_metadata(merged)
     if schema is tbl.schema:
         return tbl
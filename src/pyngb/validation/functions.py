@@ -3,11 +3,10 @@
 import numpy as np
 import polars as pl
 import pyarrow as pa
-from scipy.signal import find_peaks
 
 from ..constants import FileMetadata
 from .checker import QualityChecker
-from .helpers import _ensure_polars_dataframe
+from .helpers import _column_values
 
 
 def validate_sta_data(
@@ -53,29 +52,29 @@ def check_temperature_profile(
     Returns:
         Dictionary with temperature profile analysis
     """
-    # Optimize: use helper function to avoid unnecessary conversions
-    df = _ensure_polars_dataframe(data)
-
-    if "sample_temperature" not in df.columns:
+    temp_data = _column_values(data, "sample_temperature")
+    if temp_data is None:
         return {"error": "No sample_temperature column found"}
 
-    temp_data = df.select("sample_temperature").to_numpy().flatten()
-
     # Handle NaN and infinite values
-    temp_data_clean = temp_data[~np.isnan(temp_data) & ~np.isinf(temp_data)]
+    temp_data_clean = temp_data[np.isfinite(temp_data)]
 
     if len(temp_data_clean) == 0:
         return {"error": "No valid temperature data (all NaN or infinite)"}
 
+    # One min/max pass feeds the range, and one diff feeds the monotonicity
+    # checks and the average rate
+    min_temperature = float(temp_data_clean.min())
+    max_temperature = float(temp_data_clean.max())
+    steps = np.diff(temp_data_clean)
+
     analysis: dict[str, str | float | bool] = {
-        "temperature_range": float(np.ptp(temp_data_clean)),
-        "min_temperature": float(np.min(temp_data_clean)),
-        "max_temperature": float(np.max(temp_data_clean)),
-        "is_monotonic_increasing": bool(np.all(np.diff(temp_data_clean) >= 0)),
-        "is_monotonic_decreasing": bool(np.all(np.diff(temp_data_clean) <= 0)),
-        "average_rate": float(np.mean(np.diff(temp_data_clean)))
-        if len(temp_data_clean) > 1
-        else 0.0,
+        "temperature_range": max_temperature - min_temperature,
+        "min_temperature": min_temperature,
+        "max_temperature": max_temperature,
+        "is_monotonic_increasing": bool(np.all(steps >= 0)),
+        "is_monotonic_decreasing": bool(np.all(steps <= 0)),
+        "average_rate": float(np.mean(steps)) if len(steps) else 0.0,
     }
 
     return analysis
@@ -92,16 +91,12 @@ def check_mass_data(
     Returns:
         Dictionary with mass data analysis
     """
-    # Optimize: use helper function to avoid unnecessary conversions
-    df = _ensure_polars_dataframe(data)
-
-    if "mass" not in df.columns:
+    mass_data = _column_values(data, "mass")
+    if mass_data is None:
         return {"error": "No mass column found"}
 
-    mass_data = df.select("mass").to_numpy().flatten()
-
     # Handle NaN and infinite values
-    mass_data_clean = mass_data[~np.isnan(mass_data) & ~np.isinf(mass_data)]
+    mass_data_clean = mass_data[np.isfinite(mass_data)]
 
     if len(mass_data_clean) == 0:
         return {"error": "No valid mass data (all NaN or infinite)"}
@@ -139,6 +134,9 @@ def _significant_extrema(x: np.ndarray) -> tuple[int, int]:
         # significant relative to it.
         return 0, 0
 
+    # Deferred: scipy.signal is slow to import and only this check needs it
+    from scipy.signal import find_peaks
+
     threshold = 5.0 * sigma
     maxima, _ = find_peaks(x, prominence=threshold, height=median + threshold)
     # For minima, mirror the trace: -x[i] >= threshold - median <=> x[i] <= median - threshold
@@ -155,32 +153,31 @@ def check_dsc_data(data: pa.Table | pl.DataFrame) -> dict[str, str | float | int
     Returns:
         Dictionary with DSC data analysis
     """
-    # Optimize: use helper function to avoid unnecessary conversions
-    df = _ensure_polars_dataframe(data)
-
-    if "dsc_signal" not in df.columns:
+    dsc_data = _column_values(data, "dsc_signal")
+    if dsc_data is None:
         return {"error": "No dsc_signal column found"}
 
-    dsc_data = df.select("dsc_signal").to_numpy().flatten()
-
     # Handle NaN and infinite values
-    dsc_data_clean = dsc_data[~np.isnan(dsc_data) & ~np.isinf(dsc_data)]
+    dsc_data_clean = dsc_data[np.isfinite(dsc_data)]
 
     if len(dsc_data_clean) == 0:
         return {"error": "No valid DSC data (all NaN or infinite)"}
 
     peaks_positive, peaks_negative = _significant_extrema(dsc_data_clean)
 
+    # Each reduction runs once and is shared by the derived statistics
+    signal_min = float(dsc_data_clean.min())
+    signal_max = float(dsc_data_clean.max())
+    signal_std = float(np.std(dsc_data_clean))
+
     analysis: dict[str, str | float | int] = {
-        "signal_range": float(np.ptp(dsc_data_clean)),
-        "signal_std": float(np.std(dsc_data_clean)),
+        "signal_range": signal_max - signal_min,
+        "signal_std": signal_std,
         "peaks_detected": int(peaks_positive + peaks_negative),
         "positive_peaks": int(peaks_positive),
         "negative_peaks": int(peaks_negative),
-        "signal_to_noise": float(
-            np.max(np.abs(dsc_data_clean)) / np.std(dsc_data_clean)
-        )
-        if np.std(dsc_data_clean) > 0
+        "signal_to_noise": max(abs(signal_min), abs(signal_max)) / signal_std
+        if signal_std > 0
         else 0.0,
     }
 
@@ -1,5 +1,6 @@
 """Helper functions for validation."""
 
+import numpy as np
 import polars as pl
 import pyarrow as pa
 
@@ -18,24 +19,25 @@ def finite_values(series: pl.Series) -> pl.Series:
     return s
 
 
-def _ensure_polars_dataframe(data: pa.Table | pl.DataFrame) -> pl.DataFrame:
-    """Helper function to efficiently convert data to Polars DataFrame.
+def _column_values(data: pa.Table | pl.DataFrame, column: str) -> np.ndarray | None:
+    """Return one column as a NumPy array, or None if the column is absent.
 
-    Avoids unnecessary conversions when data is already a Polars DataFrame.
+    The standalone checks only read a single column, so it is taken straight
+    from whichever container was passed instead of converting a whole Arrow
+    table to a Polars DataFrame first.
 
     Args:
         data: Input data as PyArrow Table or Polars DataFrame
+        column: Column name to extract
 
     Returns:
-        Polars DataFrame
+        Column values, or None when ``data`` has no such column
     """
-    if isinstance(data, pl.DataFrame):
-        return data
     if isinstance(data, pa.Table):
-        df_temp = pl.from_arrow(data)
-        return df_temp if isinstance(df_temp, pl.DataFrame) else df_temp.to_frame()
-    if isinstance(data, pl.Series):
-        return pl.DataFrame(data)
-    # If data is not a recognized type, assume it's already a DataFrame-like object
-    # This should not happen in normal usage, but provides a fallback
-    return pl.DataFrame(data)
+        if column not in data.column_names:
+            return None
+        values: np.ndarray = data.column(column).to_numpy()
+        return values
+    if column not in data.columns:
+        return None
+    return data.get_column(column).to_numpy()
@@ -34,8 +34,10 @@ class TemperatureValidator:
             result.add_error("Temperature has no valid (non-null, finite) values")
             return
 
-        self._check_temperature_range(result, temp)
-        self._check_physical_validity(result, temp)
+        temp_min = float(temp.min())
+        temp_max = float(temp.max())
+        self._check_temperature_range(result, temp_min, temp_max)
+        self._check_physical_validity(result, temp_min, temp_max)
         self._check_temperature_profile(result, temp)
 
     def _check_missing_values(self, result: ValidationResult) -> None:
@@ -52,12 +54,9 @@ class TemperatureValidator:
             result.add_warning(f"Temperature has {non_finite} non-finite values")
 
     def _check_temperature_range(
-        self, result: ValidationResult, temp: np.ndarray
+        self, result: ValidationResult, temp_min: float, temp_max: float
     ) -> None:
         """Check temperature range is reasonable."""
-        temp_min = float(temp.min())
-        temp_max = float(temp.max())
-
         if temp_min == temp_max:
             result.add_error("Temperature is constant throughout experiment")
         elif temp_max - temp_min < 10:
@@ -66,12 +65,9 @@ class TemperatureValidator:
             result.add_pass("Temperature range is reasonable")
 
     def _check_physical_validity(
-        self, result: ValidationResult, temp: np.ndarray
+        self, result: ValidationResult, temp_min: float, temp_max: float
     ) -> None:
         """Check for physically realistic temperatures."""
-        temp_min = float(temp.min())
-        temp_max = float(temp.max())
-
         if temp_min < -273:  # Below absolute zero
             result.add_error(f"Temperature below absolute zero: {temp_min:.1f}°C")
         elif temp_min < -50:
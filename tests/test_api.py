@@ -5,6 +5,8 @@ This module tests the public API functions including read_ngb.
 """
 
 import json
+import subprocess
+import sys
 import zipfile
 from pathlib import Path
 from unittest.mock import patch
@@ -234,3 +236,37 @@ class TestReadNGBMetadataPaths:
         """A bogus dynamic_axis is rejected up front, before any file I/O."""
         with pytest.raises(ValueError, match="dynamic_axis"):
             read_ngb("does-not-exist.ngb-ss3", dynamic_axis="bogus")
+
+
+class TestPackageExports:
+    """The top-level namespace resolves its exports lazily."""
+
+    def test_every_public_name_resolves(self) -> None:
+        import pyngb
+
+        for name in pyngb.__all__:
+            assert getattr(pyngb, name) is not None
+        assert pyngb.read_ngb is read_ngb
+
+    def test_unknown_attribute_raises(self) -> None:
+        import pyngb
+
+        with pytest.raises(AttributeError, match="no attribute 'not_a_name'"):
+            pyngb.not_a_name  # noqa: B018
+
+    def test_dir_lists_lazy_exports(self) -> None:
+        import pyngb
+
+        assert "read_ngb" in dir(pyngb)
+        assert "BatchProcessor" in dir(pyngb)
+
+    def test_subpackages_resolve_after_bare_import(self) -> None:
+        # A fresh interpreter, so earlier tests cannot have imported them
+        code = (
+            "import pyngb\n"
+            "for name in ('analysis', 'api', 'batch', 'format', 'util', "
+            "'validation'):\n"
+            "    assert getattr(pyngb, name).__name__ == f'pyngb.{name}'\n"
+            "assert 'api' in dir(pyngb)\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -8,7 +8,13 @@ import polars as pl
 import pyarrow as pa
 import pytest
 
-from pyngb.api.analysis import add_dtg, calculate_table_dtg, normalize_to_initial_mass
+from pyngb.api.analysis import (
+    _parse_file_metadata,
+    add_dtg,
+    calculate_table_dtg,
+    normalize_to_initial_mass,
+)
+from pyngb.util import get_column_metadata
 
 
 class TestAddDTG:
@@ -77,6 +83,40 @@ class TestAddDTG:
         assert result_table.schema.metadata is not None
         assert result_table.schema.metadata == self.table.schema.metadata
 
+    def test_existing_columns_shared_unchanged(self) -> None:
+        """Input columns pass through with their types and values intact."""
+        result_table = add_dtg(self.table)
+
+        for name in self.table.column_names:
+            assert result_table.field(name).equals(
+                self.table.field(name), check_metadata=True
+            )
+            assert result_table.column(name).equals(self.table.column(name))
+
+    def test_float32_mass_gives_float32_dtg(self) -> None:
+        table = self.table.set_column(
+            self.table.schema.get_field_index("mass"),
+            "mass",
+            self.table.column("mass").cast(pa.float32()),
+        )
+        result_table = add_dtg(table)
+        assert result_table.field("dtg").type == pa.float32()
+        np.testing.assert_allclose(
+            result_table.column("dtg").to_numpy(),
+            add_dtg(self.table).column("dtg").to_numpy(),
+            rtol=1e-4,
+            atol=1e-5,
+        )
+
+    def test_recompute_replaces_existing_column(self) -> None:
+        """Adding DTG under an existing name replaces that column in place."""
+        once = add_dtg(self.table, smooth="strict")
+        twice = add_dtg(once, smooth="loose")
+
+        assert twice.column_names == once.column_names
+        assert get_column_metadata(twice, "dtg")["units"] == "mg/min"
+        assert not twice.column("dtg").equals(once.column("dtg"))
+
     def test_missing_time_column(self) -> None:
         """Test error handling when time column is missing."""
         table_no_time = self.table.drop(["time"])
@@ -366,6 +406,56 @@ class TestNormalizeToInitialMass:
         # Metadata should be identical
         assert result_table.schema.metadata == self.table.schema.metadata
 
+    def test_untouched_columns_shared_unchanged(self) -> None:
+        """Columns that are not normalized keep their field and buffers."""
+        result_table = normalize_to_initial_mass(self.table, columns=["mass"])
+
+        for name in ("time", "dsc_signal", "sample_temperature", "other_data"):
+            assert result_table.field(name).equals(
+                self.table.field(name), check_metadata=True
+            )
+            assert result_table.column(name).chunk(0).buffers()[1].address == (
+                self.table.column(name).chunk(0).buffers()[1].address
+            )
+
+    def test_integer_column_normalizes_to_float(self) -> None:
+        table = self.table.append_column("counts", pa.array([3] * 50))
+        result_table = normalize_to_initial_mass(table, columns=["counts"])
+        assert result_table.field("counts").type == pa.float64()
+        np.testing.assert_allclose(result_table.column("counts").to_numpy(), 3 / 15.75)
+
+    def test_float16_column_normalizes_to_float64(self) -> None:
+        table = self.table.append_column(
+            "half", pa.array(np.full(50, 3.0, dtype=np.float16))
+        )
+        result_table = normalize_to_initial_mass(table, columns=["half"])
+        assert result_table.field("half").type == pa.float64()
+        np.testing.assert_allclose(result_table.column("half").to_numpy(), 3 / 15.75)
+
+    def test_explicit_sample_mass(self) -> None:
+        table = self.table.replace_schema_metadata(None)
+        result_table = normalize_to_initial_mass(
+            table, columns=["mass"], sample_mass=2.0
+        )
+        np.testing.assert_allclose(
+            result_table.column("mass").to_numpy(),
+            table.column("mass").to_numpy() / 2.0,
+        )
+
+        with pytest.raises(ValueError, match="Invalid sample_mass"):
+            normalize_to_initial_mass(table, sample_mass=0)
+
+    def test_repeated_calls_parse_metadata_once(self) -> None:
+        normalize_to_initial_mass(self.table, columns=["mass"])
+        hits = _parse_file_metadata.cache_info().hits
+        normalize_to_initial_mass(self.table, columns=["dsc_signal"])
+        assert _parse_file_metadata.cache_info().hits == hits + 1
+
+    def test_cached_metadata_is_read_only(self) -> None:
+        metadata = _parse_file_metadata(self.table.schema.metadata[b"file_metadata"])
+        with pytest.raises(TypeError):
+            metadata["sample_mass"] = 1.0  # type: ignore[index]
+
     def test_missing_metadata_error(self) -> None:
         """Test error when table has no metadata."""
         table_no_meta = pa.table(
@@ -464,6 +554,8 @@ class TestNormalizeToInitialMass:
 
         with pytest.raises(ValueError, match="not numeric and cannot be normalized"):
             normalize_to_initial_mass(table_with_string, columns=["string_col"])
+        with pytest.raises(ValueError, match="'string_col' is not numeric"):
+            normalize_to_initial_mass(table_with_string, columns=["mass", "string_col"])
 
     def test_no_default_columns_error(self) -> None:
         """Test error when no default columns are found."""
@@ -212,6 +212,11 @@ class TestNGBDataset:
         dataset = NGBDataset.from_directory(str(test_dir), pattern="*.ngb-bs3")
         assert sorted(dataset.files) == sorted(test_dir.glob("*.ngb-bs3"))
 
+    def test_ngb_dataset_from_missing_directory(self, tmp_path: Path) -> None:
+        """A directory that does not exist yields an empty dataset."""
+        dataset = NGBDataset.from_directory(str(tmp_path / "missing"))
+        assert dataset.files == []
+
     def test_ngb_dataset_get_summary(self) -> None:
         """Test getting dataset summary."""
         dataset = NGBDataset([])
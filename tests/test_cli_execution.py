@@ -225,6 +225,61 @@ class TestCLIExecution:
         # The good file was still converted
         assert (output_dir / f"{test_file.stem}.parquet").exists()
 
+    def test_cli_command_execution_parallel_jobs(self, tmp_path: Any) -> None:
+        """--jobs converts files in worker processes with the same per-file
+        error isolation and reporting as the sequential path."""
+        test_files = [
+            Path("tests/test_files/Red_Oak_STA_10K_250731_R7.ngb-ss3"),
+            Path("tests/test_files/DF_FILED_STA_21O2_10K_220222_R1.ngb-ss3"),
+        ]
+        if not all(f.exists() for f in test_files):
+            pytest.skip("Test files not available")
+
+        output_dir = tmp_path / "cli_parallel_output"
+        output_dir.mkdir()
+
+        cmd = [
+            sys.executable,
+            "-m",
+            "pyngb",
+            "convert",
+            *[str(f) for f in test_files],
+            "missing_file.ngb-ss3",
+            "-o",
+            str(output_dir),
+            "-j",
+            "2",
+        ]
+
+        result = subprocess.run(cmd, capture_output=True, text=True)
+
+        assert result.returncode != 0, "CLI should fail when any file fails"
+        assert "missing_file.ngb-ss3" in result.stderr
+        assert "1 of 3 file(s) failed" in result.stderr
+        for f in test_files:
+            assert pq.read_table(output_dir / f"{f.stem}.parquet").num_rows > 0
+            # Worker processes log like the sequential path
+            assert f"Successfully parsed {f}" in result.stderr
+
+    def test_cli_command_execution_invalid_jobs(self, tmp_path: Any) -> None:
+        """A non-positive --jobs is rejected before any file is touched."""
+        cmd = [
+            sys.executable,
+            "-m",
+            "pyngb",
+            "convert",
+            "missing_file.ngb-ss3",
+            "-o",
+            str(tmp_path),
+            "-j",
+            "0",
+        ]
+
+        result = subprocess.run(cmd, capture_output=True, text=True)
+
+        assert result.returncode != 0
+        assert "--jobs must be at least 1" in result.stderr
+
     def test_cli_command_execution_not_a_zip(self, tmp_path: Any) -> None:
         """A non-ZIP input gets a friendly message, not a traceback."""
         bogus = tmp_path / "bogus.ngb-ss3"
@@ -4,6 +4,7 @@ from __future__ import annotations
 from typing import Any
 
 import numpy as np
+import polars as pl
 import pyarrow as pa
 import pytest
 
@@ -28,6 +29,7 @@ from pyngb.util import (
     set_column_metadata,
     set_default_column_metadata,
     update_column_metadata,
+    with_polars,
 )
 
 
@@ -174,6 +176,24 @@ class TestUtilityFunctions:
             else:
                 assert "baseline_subtracted" not in metadata
 
+    def test_with_polars_restores_metadata(self) -> None:
+        """Test that a Polars round trip keeps table and column metadata."""
+        table = initialize_table_column_metadata(self.table)
+        table = table.replace_schema_metadata({b"file_metadata": b"{}"})
+
+        result = with_polars(
+            table,
+            lambda df: df.drop("time").with_columns(
+                (pl.col("mass") * 2).alias("mass"), pl.lit(1.0).alias("extra")
+            ),
+        )
+
+        assert result.schema.metadata == table.schema.metadata
+        for column in ("sample_temperature", "mass"):
+            assert result.field(column).metadata == table.field(column).metadata
+        assert not result.field("extra").metadata
+        assert "time" not in result.column_names
+
     def test_error_handling(self) -> None:
         """Test error handling for invalid inputs."""
         # Test non-existent column
@@ -160,6 +160,15 @@ class TestOpenNgb:
         with pytest.raises(NGBStreamNotFoundError):
             open_ngb(path, streams=[1, 2])
 
+    def test_optional_streams_load_only_when_present(self, tmp_path: Path) -> None:
+        path = write_ngb(
+            tmp_path / "two.ngb-ss3",
+            {1: one_section_stream(1), 2: two_section_stream(2)},
+        )
+        assert set(open_ngb(path, streams=[1], optional=[2, 3])) == {1, 2}
+        with pytest.raises(NGBStreamNotFoundError):
+            open_ngb(path, streams=[3], optional=[1])
+
     def test_oversized_stream_rejected_before_decompression(
         self, tmp_path: Path
     ) -> None:
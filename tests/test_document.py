@@ -181,6 +181,12 @@ class TestQueryHelpers:
         assert doc.first(1, category=0x9999) is None
         assert doc.first(2) is None  # stream not loaded
 
+    def test_find_combines_category_with_other_filters(self, doc) -> None:
+        found = doc.find(1, category=0x7530, with_fields=(0x0840,), type_ref=0x0BC7)
+        assert [t.index for t in found] == [2]
+        assert [t.index for t in doc.find(1, category=0x1772)] == [0]
+        assert list(doc.by_category(2, 0x7530)) == []  # stream not loaded
+
     def test_strings(self, doc) -> None:
         assert doc.tables_of(1)[1].strings() == ["name", "id"]
 
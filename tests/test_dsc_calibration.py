@@ -286,6 +286,24 @@ class TestDSCCalibration:
         calibrated_data = calibrated_df["dsc_signal"].to_numpy()  # type: ignore[index]
         assert not np.array_equal(original_data, calibrated_data)
 
+    def test_other_columns_untouched(self) -> None:
+        """Only the DSC column is replaced; every other column keeps its
+        values, type and metadata, and the schema metadata survives."""
+        test_file = Path("tests/test_files/Red_Oak_STA_10K_250731_R7.ngb-ss3")
+        table = read_ngb(str(test_file))
+
+        calibrated_table = apply_dsc_calibration(table)
+
+        assert calibrated_table.column_names == table.column_names
+        assert calibrated_table.schema.metadata == table.schema.metadata
+        for name in table.column_names:
+            if name == "dsc_signal":
+                continue
+            assert calibrated_table.field(name).equals(
+                table.field(name), check_metadata=True
+            )
+            assert calibrated_table.column(name).equals(table.column(name))
+
 
 class TestSensitivityGuards:
     """The calibration polynomial is only meaningful inside its fitted range;
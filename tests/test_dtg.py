@@ -35,6 +35,19 @@ class TestDTG:
         expected = 3.0
         assert abs(np.mean(result) - expected) < 0.1
 
+    @pytest.mark.parametrize("method", ["savgol", "gradient"])
+    def test_float32_mass_preserved(self, method: str) -> None:
+        """float32 mass keeps its width; integer mass is promoted to float64."""
+        mass32 = self.mass_linear.astype(np.float32)
+        result = dtg(self.time, mass32, method=method)
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(
+            result, dtg(self.time, self.mass_linear, method=method), rtol=1e-4
+        )
+
+        mass_int = (self.mass_linear * 1000).astype(np.int64)
+        assert dtg(self.time, mass_int, method=method).dtype == np.float64
+
     def test_basic_dtg_gradient(self) -> None:
         """Test basic DTG calculation with gradient method."""
         result = dtg(self.time, self.mass_linear, method="gradient")
@@ -12,6 +12,7 @@ identical frames for both files.
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
 
 import numpy as np
 import polars as pl
@@ -99,6 +100,12 @@ class TestCorrectedRun:
         mass_field = table.schema.field("mass")
         assert b"baseline_corrected" in mass_field.metadata[b"processing_history"]
 
+    def test_corrected_loads_the_file_once(self) -> None:
+        """The file is both sample and baseline; its document is shared."""
+        with patch("pyngb.api.loaders.load_document", wraps=load_document) as loader:
+            read_ngb(DS3_G, run="corrected")
+        assert loader.call_count == 1
+
     def test_corrected_on_a_single_run_file_raises(self) -> None:
         with pytest.raises(ValueError, match="no embedded correction run"):
             read_ngb(SS3, run="corrected")
@@ -277,6 +277,14 @@ class TestGetHash:
         # Cleanup
         Path(temp_file_path).unlink()
 
+    def test_get_hash_spans_multiple_chunks(self, tmp_path: Path) -> None:
+        """Content longer than one 1 MiB chunk hashes as one stream."""
+        content = bytes(range(256)) * (5 * 4096 + 7)  # ~5 MiB, uneven tail
+        file_path = tmp_path / "multi_chunk.bin"
+        file_path.write_bytes(content)
+
+        assert get_hash(file_path) == hashlib.blake2b(content).hexdigest()
+
     def test_get_hash_binary_file(self) -> None:
         """Test get_hash with binary content."""
         with tempfile.NamedTemporaryFile(delete=False) as temp_file:
@@ -4,6 +4,7 @@ Unit tests for the validation module of pyngb.
 
 import numpy as np
 import polars as pl
+import pyarrow as pa
 import pytest
 from typing import Any
 
@@ -361,6 +362,16 @@ class TestSpecificValidationFunctions:
         analysis = check_temperature_profile(data_no_temp)
         assert "error" in analysis
 
+    @pytest.mark.parametrize(
+        "check", [check_temperature_profile, check_mass_data, check_dsc_data]
+    )
+    def test_arrow_and_polars_inputs_agree(
+        self, sample_sta_data: Any, check: Any
+    ) -> None:
+        """Arrow tables are read column-wise, not converted; results match."""
+        assert check(sample_sta_data.to_arrow()) == check(sample_sta_data)
+        assert "error" in check(pa.table({"other": [1.0, 2.0]}))
+
     def test_check_mass_data(self, sample_sta_data: Any) -> None:
         """Test mass data checking."""
         analysis = check_mass_data(sample_sta_data)